@@ -1,18 +1,37 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, Field
+from cachetools import TTLCache
+from contextlib import asynccontextmanager
+from functools import lru_cache
 import asyncio
 import sys
 import os
 from decimal import Decimal
-import json
+import weakref
 
 # Import your existing portfolio class
 # Make sure your portfolio.py file is in the same directory
-from portfolio import TxPortfolio, Token
+from portfolio import CHAINS, USD_DECIMALS, TxPortfolio, Token, create_http_client, scaled_to_decimal
 
-app = FastAPI(title="DeFi Portfolio API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Share one pooled HTTP client and portfolio service across all requests
+    async with create_http_client() as http_client:
+        portfolio_service = TxPortfolio(http_client)
+        await portfolio_service.init_clients()
+        app.state.portfolio_service = portfolio_service
+        try:
+            yield
+        finally:
+            await portfolio_service.close()
+
+# Recent portfolio results keyed by (wallet, min_balance), so repeated refreshes skip the upstreams
+portfolio_cache: TTLCache = TTLCache(maxsize=512, ttl=30)
+# One lock per cache key, so concurrent requests for the same wallet share a single fetch
+portfolio_locks: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+
+app = FastAPI(title="DeFi Portfolio API", version="1.0.0", lifespan=lifespan)
 
 # Add CORS middleware to allow frontend connections
 app.add_middleware(
@@ -24,82 +43,63 @@ app.add_middleware(
 )
 
 class PortfolioRequest(BaseModel):
-    wallet_address: str
-    min_balance: float = 0.000001
-
-class TokenResponse(BaseModel):
-    chain_id: int
-    address: str
-    symbol: str
-    name: str
-    decimals: int
-    balance: str  # Use string to preserve precision
-    logo_uri: str = None
-    usd_price: str = None  # Use string to preserve precision
-    usd_value: str = None  # Use string to preserve precision
-    chain_name: str
-
-class PortfolioResponse(BaseModel):
-    wallet_address: str
-    tokens: List[TokenResponse]
-    total_usd_value: str
-    total_tokens: int
+    # Validated by Pydantic before the handler runs
+    wallet_address: str = Field(pattern=r"^0x[0-9a-fA-F]{40}$")
+    min_balance: Decimal = Decimal("0.000001")
 
 def decimal_to_str(value: Decimal) -> str:
     """Convert Decimal to string for JSON serialization"""
     return str(value) if value is not None else None
 
-def token_to_response(token: Token, chain_name: str) -> TokenResponse:
-    """Convert Token object to TokenResponse"""
-    return TokenResponse(
-        chain_id=token.chain_id,
-        address=token.address,
-        symbol=token.symbol,
-        name=token.name,
-        decimals=token.decimals,
-        balance=decimal_to_str(token.balance),
-        logo_uri=token.logo_uri,
-        usd_price=decimal_to_str(token.usd_price),
-        usd_value=decimal_to_str(token.usd_value),
-        chain_name=chain_name
-    )
+def token_to_response(token: Token, chain_name: str) -> dict:
+    """Convert Token object to a response dict, amounts as strings to preserve precision"""
+    return {
+        "chain_id": token.chain_id,
+        "address": token.address,
+        "symbol": token.symbol,
+        "name": token.name,
+        "decimals": token.decimals,
+        "balance": decimal_to_str(token.balance),
+        "logo_uri": token.logo_uri,
+        "usd_price": decimal_to_str(token.usd_price),
+        "usd_value": decimal_to_str(token.usd_value),
+        "chain_name": chain_name
+    }
 
 @app.get("/")
 async def root():
     return {"message": "DeFi Portfolio API is running"}
 
-@app.post("/portfolio", response_model=PortfolioResponse)
+@app.post("/portfolio")
 async def get_portfolio(request: PortfolioRequest):
     """Get portfolio for a given wallet address"""
     try:
-        # Validate wallet address format
-        if not request.wallet_address or len(request.wallet_address) != 42 or not request.wallet_address.startswith('0x'):
-            raise HTTPException(status_code=400, detail="Invalid wallet address format")
-        
-        # Create portfolio instance
-        portfolio_manager = TxPortfolio(request.wallet_address)
+        portfolio_service = app.state.portfolio_service
         
-        # Get portfolio data
-        tokens = portfolio_manager.get_portfolio(min_balance=Decimal(str(request.min_balance)))
+        # Get portfolio data, reusing a recent result for the same wallet
+        cache_key = (request.wallet_address.lower(), request.min_balance)
+        lock = portfolio_locks.setdefault(cache_key, asyncio.Lock())
+        async with lock:
+            cached = portfolio_cache.get(cache_key)
+            if cached is None:
+                cached = await portfolio_service.get_portfolio(
+                    request.wallet_address, min_balance=request.min_balance
+                )
+                portfolio_cache[cache_key] = cached
+        tokens, total_value_micros = cached
         
-        # Calculate total value
-        total_value = Decimal("0")
         token_responses = []
-        
         for token in tokens:
-            chain_name = portfolio_manager.chains.get(token.chain_id, {}).get("name", f"Chain {token.chain_id}")
-            token_response = token_to_response(token, chain_name)
-            token_responses.append(token_response)
-            
-            if token.usd_value:
-                total_value += token.usd_value
+            chain_name = portfolio_service.chains.get(token.chain_id, {}).get("name", f"Chain {token.chain_id}")
+            token_responses.append(token_to_response(token, chain_name))
         
-        return PortfolioResponse(
-            wallet_address=request.wallet_address,
-            tokens=token_responses,
-            total_usd_value=decimal_to_str(total_value),
-            total_tokens=len(token_responses)
-        )
+        # Server-built data, so return a plain dict with no response model to validate
+        return {
+            "wallet_address": request.wallet_address,
+            "tokens": token_responses,
+            "total_usd_value": decimal_to_str(scaled_to_decimal(total_value_micros, USD_DECIMALS)),
+            "total_tokens": len(token_responses)
+        }
         
     except Exception as e:
         print(f"Error getting portfolio: {e}")
@@ -110,24 +110,23 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "message": "API is running"}
 
+@lru_cache(maxsize=1)
+def get_chain_info() -> dict:
+    """Build the supported chain summary once from the loaded chain configs"""
+    chain_info = {}
+    for chain_id, config in CHAINS.items():
+        chain_info[str(chain_id)] = {
+            "name": config.get("name"),
+            "symbol": config.get("symbol"),
+            "chain_id": chain_id
+        }
+    return chain_info
+
 @app.get("/chains")
 async def get_supported_chains():
     """Get list of supported chains"""
     try:
-        # You might want to create a minimal portfolio instance just to get chains
-        # or move the chains.json loading to a separate utility
-        with open('chains.json', 'r') as file:
-            chains = json.load(file)
-        
-        chain_info = {}
-        for chain_id, config in chains.items():
-            chain_info[chain_id] = {
-                "name": config.get("name"),
-                "symbol": config.get("symbol"),
-                "chain_id": int(chain_id)
-            }
-        
-        return {"chains": chain_info}
+        return {"chains": get_chain_info()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading chains: {str(e)}")
 
@@ -1,111 +1,288 @@
-import requests
-import json
+import asyncio
+import aiohttp
+import httpx
+import orjson
 from decimal import Decimal
 from typing import List, Optional
-from dataclasses import dataclass
-from web3 import Web3
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
+from web3.contract import AsyncContract
+import itertools
 import sys
-
-@dataclass
+import time
+
+# Chain configs keyed by integer chain ID, loaded once at import
+CHAINS: dict[int, dict] = {
+    int(k): v for k, v in orjson.loads((Path(__file__).parent / "chains.json").read_bytes()).items()
+}
+
+# USD values and totals are carried as integer micro-USD until they are displayed
+USD_DECIMALS = 6
+USD_SCALE = 10 ** USD_DECIMALS
+# Unit prices need far finer resolution, so they are scaled by 10 ** 18
+PRICE_DECIMALS = 18
+PRICE_SCALE = 10 ** PRICE_DECIMALS
+# Precomputed 10 ** decimals for every scale a uint256 amount times a price can need
+_SCALE = {d: 10 ** d for d in range(78 + PRICE_DECIMALS)}
+
+def scaled_to_decimal(value: Optional[int], decimals: int) -> Optional[Decimal]:
+    """Convert a scaled integer amount to an exact Decimal for display"""
+    if value is None:
+        return None
+    # Build from the digit tuple, arithmetic like scaleb would round to the context precision
+    return Decimal((int(value < 0), tuple(map(int, str(abs(value)))), -decimals))
+
+def _usd_value_micros(raw_balance: int, decimals: int, usd_price_scaled: int) -> int:
+    """Value of a raw token balance in micro-USD, given a PRICE_SCALE unit price"""
+    return raw_balance * usd_price_scaled // _SCALE[decimals + PRICE_DECIMALS - USD_DECIMALS]
+
+# ERC-20 balanceOf(address) selector
+BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+# Multicall3 getEthBalance(address), lets the native balance ride in the same batch
+GET_ETH_BALANCE_SELECTOR = bytes.fromhex("4d2301cc")
+
+@lru_cache(maxsize=512)
+def _balance_calldata(wallet: str) -> tuple[bytes, bytes]:
+    """Returns the (balanceOf, getEthBalance) calldata for a wallet, encoded once per wallet"""
+    padded_wallet = bytes(12) + bytes.fromhex(wallet[2:])
+    return BALANCE_OF_SELECTOR + padded_wallet, GET_ETH_BALANCE_SELECTOR + padded_wallet
+
+def _portfolio_sort_key(token: "Token") -> int:
+    """Sort by micro-USD value, falling back to the balance for unpriced tokens"""
+    return token.usd_value_micros or token.raw_balance * USD_SCALE // _SCALE[token.decimals]
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the shared, connection-pooled HTTP client for outbound requests"""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+
+@dataclass(slots=True)
 class Token:
     """Token data structure"""
     chain_id: int
-    address: str
+    address: str  # Checksummed
     symbol: str
     name: str
     decimals: int
-    chain_id: int
     logo_uri: str
-    balance: Decimal = Decimal('0')
-    usd_price: Decimal = Decimal('0')
-    usd_value: Decimal = Decimal('0')
+    raw_balance: int = 0
+    usd_price_scaled: Optional[int] = None
+    usd_value_micros: Optional[int] = None
+    address_lc: str = field(init=False)
+
+    def __post_init__(self):
+        self.address_lc = self.address.lower()
+
+    @property
+    def balance(self) -> Decimal:
+        return scaled_to_decimal(self.raw_balance, self.decimals)
+
+    @property
+    def usd_price(self) -> Optional[Decimal]:
+        return scaled_to_decimal(self.usd_price_scaled, PRICE_DECIMALS)
+
+    @property
+    def usd_value(self) -> Optional[Decimal]:
+        return scaled_to_decimal(self.usd_value_micros, USD_DECIMALS)
 
 
 class TxPortfolio:
 
-    # ERC-20 balanceOf function signature
-    BALANCE_OF_ABI = [
+    # Multicall3 aggregate3 function signature
+    AGGREGATE3_ABI = [
         {
-            "constant": True,
-            "inputs": [{"name": "_owner", "type": "address"}],
-            "name": "balanceOf",
-            "outputs": [{"name": "balance", "type": "uint256"}],
+            "inputs": [
+                {
+                    "components": [
+                        {"name": "target", "type": "address"},
+                        {"name": "allowFailure", "type": "bool"},
+                        {"name": "callData", "type": "bytes"}
+                    ],
+                    "name": "calls",
+                    "type": "tuple[]"
+                }
+            ],
+            "name": "aggregate3",
+            "outputs": [
+                {
+                    "components": [
+                        {"name": "success", "type": "bool"},
+                        {"name": "returnData", "type": "bytes"}
+                    ],
+                    "name": "returnData",
+                    "type": "tuple[]"
+                }
+            ],
+            "stateMutability": "payable",
             "type": "function"
         }
     ]
+    # Canonical Multicall3 deployment, chains.json can override it per chain
+    MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
     ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+    # Max concurrent requests to CoinGecko
+    PRICE_CONCURRENCY = 20
+    # Max concurrent multicall requests across all RPC endpoints
+    RPC_CONCURRENCY = 20
+    # Max calls per aggregate3 eth_call, keeps each batch under RPC gas and calldata caps
+    MULTICALL_BATCH_SIZE = 500
+    # Max contract addresses per CoinGecko request, keeps the query string under URL limits
+    PRICE_BATCH_SIZE = 100
+    # Seconds before a cached token list is re-fetched
+    TOKEN_LIST_TTL = 3600
+    # Seconds before a cached price is re-fetched
+    PRICE_CACHE_TTL = 600
+    # Holdings worth less than this (1 cent) keep their cached price even once stale
+    DUST_VALUE_MICROS = USD_SCALE // 100
+    # Seconds to wait before re-probing a chain whose RPC could not be reached
+    CLIENT_RETRY_INTERVAL = 60
+
+    # Parsed token lists shared across instances: chain_id -> (fetched_at, tokens)
+    _token_list_cache: dict[int, tuple[float, List[Token]]] = {}
     
-    def __init__(self, wallet: str):
-
-        self.wallet = Web3.to_checksum_address(wallet)
-        with open('chains.json', 'r') as file:
-            chains_raw = json.load(file)
-            # Convert string keys to integers for chain IDs
-            self.chains = {int(k): v for k, v in chains_raw.items()}
-        self.clients = self.init_clients()
-        self.portfolio: List[Token] = []
+    def __init__(self, http_client: httpx.AsyncClient):
+
+        self.http_client = http_client
+        self.chains = CHAINS
+        # Connected clients, probed lazily per chain on first use
+        self.clients: dict[int, AsyncWeb3] = {}
+        self._client_failed_at: dict[int, float] = {}
+        self._client_locks = {chain_id: asyncio.Lock() for chain_id in self.chains}
+        self._multicall_contracts: dict[int, AsyncContract] = {}
+        # (chain_id, address) -> (fetched_at, usd_price_scaled)
+        self._price_cache: dict[tuple[int, str], tuple[float, int]] = {}
+        # Per-chain symbols to keep from the token list, None keeps every token
+        self._symbol_allowlists: dict[int, Optional[frozenset[str]]] = {
+            chain_id: frozenset(symbol.upper() for symbol in config["symbol_allowlist"])
+            if config.get("symbol_allowlist") else None
+            for chain_id, config in self.chains.items()
+        }
         self._cmc_id_cache: dict[tuple[str, str, str], int] = {}
+        self._price_semaphore = asyncio.BoundedSemaphore(self.PRICE_CONCURRENCY)
+        self._rpc_semaphore = asyncio.BoundedSemaphore(self.RPC_CONCURRENCY)
 
 
-    def init_clients(self) -> dict[int, Web3]:
-        clients = {}
-        for chain_id, config in self.chains.items():
-            rpc = config.get("rpc")
-            try:
-                w3 = Web3(Web3.HTTPProvider(rpc))
-                if not w3.is_connected():
-                    print(f"Could not connect to RPC for chain {chain_id} ({config['name']})")
-                    continue
-                clients[chain_id] = w3
+    async def _probe_chain(self, chain_id: int, config: dict) -> Optional[AsyncWeb3]:
+        rpc = config.get("rpc")
+        w3 = None
+        try:
+            w3 = AsyncWeb3(AsyncHTTPProvider(
+                rpc, request_kwargs={"timeout": aiohttp.ClientTimeout(total=10)}
+            ))
+            if await w3.is_connected():
                 print(f"Connected to {config['name']} ({chain_id})")
-            except Exception as e:
-                print(f"Error connecting to chain {chain_id}: {e}")
-        return clients
+                return w3
+            print(f"Could not connect to RPC for chain {chain_id} ({config['name']})")
+        except Exception as e:
+            print(f"Error connecting to chain {chain_id}: {e}")
+
+        # Release the failed provider's aiohttp session
+        if w3:
+            await self._disconnect_client(chain_id, w3)
+        return None
+
+    async def _disconnect_client(self, chain_id: int, w3: AsyncWeb3):
+        try:
+            await w3.provider.disconnect()
+        except Exception as e:
+            print(f"Error disconnecting from chain {chain_id}: {e}")
+
+    async def close(self):
+        """Close every connected RPC provider's session"""
+        clients, self.clients = self.clients, {}
+        self._multicall_contracts.clear()
+        await asyncio.gather(*[
+            self._disconnect_client(chain_id, w3) for chain_id, w3 in clients.items()
+        ])
+
+    async def _get_client(self, chain_id: int) -> Optional[AsyncWeb3]:
+        """Returns the chain's client, probing it on first use and retrying failed chains after an interval"""
+        w3 = self.clients.get(chain_id)
+        if w3:
+            return w3
+
+        async with self._client_locks[chain_id]:
+            # Another request may have probed the chain while this one waited
+            w3 = self.clients.get(chain_id)
+            if w3:
+                return w3
+            failed_at = self._client_failed_at.get(chain_id)
+            if failed_at is not None and time.monotonic() - failed_at < self.CLIENT_RETRY_INTERVAL:
+                return None
+
+            w3 = await self._probe_chain(chain_id, self.chains[chain_id])
+            if w3:
+                self.clients[chain_id] = w3
+                self._client_failed_at.pop(chain_id, None)
+            else:
+                self._client_failed_at[chain_id] = time.monotonic()
+            return w3
+
+    async def init_clients(self):
+        # Warm up every chain concurrently rather than one round-trip after another
+        await asyncio.gather(*[self._get_client(chain_id) for chain_id in self.chains])
 
     
-    def fetch_tokens(self) -> List[Token]:
+    async def _fetch_chain_tokens(self, chain_id: int, config: dict) -> List[Token]:
         tokens = []
-
-        for chain_id, config in self.chains.items():
-            url = config["token_list_url"]
+        url = config["token_list_url"]
+        print(f"Fetching token list for {config['name']} ({chain_id}) from {url}")
+        response = await self.http_client.get(url, timeout=30)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+
+        symbol_allowlist = self._symbol_allowlists.get(chain_id)
+        for token_data in data.get("tokens", []):
+            # Filter before building the Token so discarded entries cost no checksum or allocation
+            if token_data.get("chainId") != chain_id:
+                continue
+            symbol = token_data["symbol"].upper()
+            if symbol_allowlist is not None and symbol not in symbol_allowlist:
+                continue
             try:
-                print(f"Fetching token list for {config['name']} ({chain_id}) from {url}")
-                response = requests.get(url, timeout=30)
-                response.raise_for_status()
-                data = response.json()
-
-                for token_data in data.get("tokens", []):
-                    if token_data.get("chainId") != chain_id:
-                        continue
-                    symbol = token_data["symbol"].upper()
-                    if symbol != "DAI":
-                        continue  # Only process DAI for now
-                    address = token_data["address"].lower()
-                    token = Token(
-                        address=address,
-                        symbol=symbol,
-                        name=token_data["name"],
-                        decimals=token_data["decimals"],
-                        chain_id=chain_id,
-                        logo_uri=token_data.get("logoURI", "")
-                    )
-                    tokens.append(token)
-
-                # Add native token
-                native_token = Token(
-                    address= self.ZERO_ADDRESS,
-                    symbol="ETH",
-                    name="Ethereum",
-                    decimals=18,
-                    chain_id=chain_id,
-                    logo_uri="https://raw.githubusercontent.com/trustwallet/assets/master/blockchains/ethereum/info/logo.png"  # Default logo for native tokens
-                )
-                tokens.append(native_token)
+                address = Web3.to_checksum_address(token_data["address"])
+            except ValueError:
+                print(f"Skipping {symbol} on chain {chain_id}: invalid address {token_data['address']!r}")
+                continue
+            token = Token(
+                address=address,
+                symbol=symbol,
+                name=token_data["name"],
+                decimals=token_data["decimals"],
+                chain_id=chain_id,
+                logo_uri=token_data.get("logoURI", "")
+            )
+            tokens.append(token)
+
+        # Add native token
+        native_token = Token(
+            address= self.ZERO_ADDRESS,
+            symbol="ETH",
+            name="Ethereum",
+            decimals=18,
+            chain_id=chain_id,
+            logo_uri="https://raw.githubusercontent.com/trustwallet/assets/master/blockchains/ethereum/info/logo.png"  # Default logo for native tokens
+        )
+        tokens.append(native_token)
 
-            except Exception as e:
-                print(f"Error loading tokens for chain {chain_id}: {e}")
+        return tokens
 
+    async def _get_token_list(self, chain_id: int) -> List[Token]:
+        """Returns the token list for a chain, re-fetching it only once the cached copy expires"""
+        cached = self._token_list_cache.get(chain_id)
+        if cached and time.monotonic() - cached[0] < self.TOKEN_LIST_TTL:
+            return cached[1]
+
+        try:
+            tokens = await self._fetch_chain_tokens(chain_id, self.chains[chain_id])
+        except Exception as e:
+            print(f"Error loading tokens for chain {chain_id}: {e}")
+            return []
+
+        self._token_list_cache[chain_id] = (time.monotonic(), tokens)
         return tokens
 
     def _is_native_token(self, token: Token) -> bool:
@@ -113,133 +290,215 @@ class TxPortfolio:
         Returns True if the given token is the native token of its chain,
         based on the zero-address convention.
         """
-        return token.address.lower() == self.ZERO_ADDRESS
+        return token.address_lc == self.ZERO_ADDRESS
 
-    def get_token_balance(self, token: Token) -> Decimal:
-        """Fetch wallet balance for a token"""
-        try:
-            w3 = self.clients.get(token.chain_id)
-            if not w3:
-                print(f"No Web3 client for chain {token.chain_id}")
-                return Decimal("0")
-            
-            # Native token
+    async def get_token_balances(self, chain_id: int, wallet: str, tokens: List[Token]) -> dict[str, int]:
+        """
+        Fetch raw wallet balances for all tokens on a chain, keyed by token address.
+        Native and ERC-20 balances are batched into Multicall3 aggregate3 calls of
+        up to MULTICALL_BATCH_SIZE entries each.
+        """
+        balances: dict[str, int] = {}
+        w3 = await self._get_client(chain_id)
+        if not w3:
+            print(f"No Web3 client for chain {chain_id}")
+            return balances
+
+        multicall = self._multicall_contracts.get(chain_id)
+        if multicall is None:
+            multicall_address = Web3.to_checksum_address(
+                self.chains[chain_id].get("multicall3_address", self.MULTICALL3_ADDRESS)
+            )
+            multicall = w3.eth.contract(address=multicall_address, abi=self.AGGREGATE3_ABI)
+            self._multicall_contracts[chain_id] = multicall
+
+        balance_of_data, get_eth_balance_data = _balance_calldata(wallet)
+        calls = []
+        for token in tokens:
             if self._is_native_token(token):
-                balance_wei = w3.eth.get_balance(self.wallet)
-                return Decimal(str(w3.from_wei(balance_wei, "ether")))
+                calls.append((multicall.address, True, get_eth_balance_data))
+            else:
+                calls.append((token.address, True, balance_of_data))
 
-            # ERC-20 token
-            contract = w3.eth.contract(address=Web3.to_checksum_address(token.address), abi=self.BALANCE_OF_ABI)
-            raw = contract.functions.balanceOf(self.wallet).call()
-            final_balance = Decimal(str(raw)) / Decimal(10 ** token.decimals)
-            return final_balance
+        async def aggregate(batch_calls: list) -> Optional[list]:
+            try:
+                async with self._rpc_semaphore:
+                    return await multicall.functions.aggregate3(batch_calls).call()
+            except Exception as e:
+                print(f"Error getting token balances on chain {chain_id}: {e}")
+                return None
 
-        except Exception as e:
-            print(f"Error getting balance for {token.symbol} on chain {token.chain_id}: {e}")
-            return Decimal("0")
+        batch_size = self.MULTICALL_BATCH_SIZE
+        batch_results = await asyncio.gather(*[
+            aggregate(calls[start:start + batch_size]) for start in range(0, len(calls), batch_size)
+        ])
+
+        for batch_index, results in enumerate(batch_results):
+            if results is None:
+                continue
+            batch_tokens = tokens[batch_index * batch_size:(batch_index + 1) * batch_size]
+            for token, (success, return_data) in zip(batch_tokens, results):
+                if not success or len(return_data) < 32:
+                    print(f"Error getting balance for {token.symbol} on chain {chain_id}")
+                    continue
+                balances[token.address] = int.from_bytes(return_data[:32], "big")
+
+        return balances
     
     def _get_token_address(self, token: Token) -> str:
         """Returns the token address, wrapped if it's the native token."""
         if self._is_native_token(token):
             chain_config = self.chains.get(token.chain_id)
             return chain_config.get("wrapped_token_address", "").lower()
-        return token.address.lower()
+        return token.address_lc
 
 
-    def get_token_usd_price(self, token: Token) -> Optional[Decimal]:
-        chain_config = self.chains.get(token.chain_id)
+    async def _fetch_prices_for_chain(self, chain_id: int, addresses: List[str]) -> dict[str, int]:
+        """Fetch PRICE_SCALE USD prices for all given addresses on a chain, PRICE_BATCH_SIZE per request"""
+        chain_config = self.chains.get(chain_id)
         if not chain_config:
-            print(f"Chain {token.chain_id} not found in config")
-            return None
+            print(f"Chain {chain_id} not found in config")
+            return {}
 
         platform_slug = chain_config.get("platform_slug")
         if not platform_slug:
-            print(f"Missing CoinGecko platform for chain {token.chain_id}")
-            return None
-
-        address = self._get_token_address(token)
+            print(f"Missing CoinGecko platform for chain {chain_id}")
+            return {}
 
         url = f"https://api.coingecko.com/api/v3/simple/token_price/{platform_slug}"
-        params = {
-            "contract_addresses": address,
-            "vs_currencies": "usd"
-        }
 
-        try:
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            if address in data and "usd" in data[address]:
-                return Decimal(str(data[address]["usd"]))
+        async def fetch_batch(batch_addresses: List[str]) -> dict[str, int]:
+            params = {
+                "contract_addresses": ",".join(batch_addresses),
+                "vs_currencies": "usd"
+            }
+            try:
+                async with self._price_semaphore:
+                    response = await self.http_client.get(url, params=params, timeout=10)
+                response.raise_for_status()
+                # Parse prices straight to Decimal so the scaled conversion is exact
+                data = response.json(parse_float=Decimal)
+                return {
+                    address.lower(): round(price["usd"] * PRICE_SCALE)
+                    for address, price in data.items()
+                    if "usd" in price
+                }
+            except Exception as e:
+                print(f"CoinGecko error fetching prices on {platform_slug}: {e}")
+                return {}
+
+        batch_size = self.PRICE_BATCH_SIZE
+        batch_prices = await asyncio.gather(*[
+            fetch_batch(addresses[start:start + batch_size]) for start in range(0, len(addresses), batch_size)
+        ])
+        prices: dict[str, int] = {}
+        for batch in batch_prices:
+            prices.update(batch)
+        return prices
+
+    async def _get_chain_portfolio(
+        self, chain_id: int, wallet: str, chain_tokens: List[Token], min_balance: Decimal
+    ) -> tuple[List[Token], int]:
+        """Returns the held tokens on a chain and their total value in micro-USD"""
+        balances = await self.get_token_balances(chain_id, wallet, chain_tokens)
+        # min_balance scaled to each token's raw units, computed once per decimals value
+        min_raw_balances: dict[int, int] = {}
+        held_tokens = []
+        for token in chain_tokens:
+            min_raw = min_raw_balances.get(token.decimals)
+            if min_raw is None:
+                min_raw = min_raw_balances[token.decimals] = int(min_balance.scaleb(token.decimals))
+            raw_balance = balances.get(token.address, 0)
+            if raw_balance <= min_raw:
+                continue
+            # Copy so the cached token list is never mutated
+            held_tokens.append(replace(token, raw_balance=raw_balance))
+
+        if not held_tokens:
+            return held_tokens, 0
+
+        # Use cached prices where fresh, or where the holding is dust, and fetch the rest in one batch
+        now = time.monotonic()
+        prices: dict[str, int] = {}
+        stale_addresses = set()
+        for token in held_tokens:
+            address = self._get_token_address(token)
+            cached = self._price_cache.get((chain_id, address))
+            if cached and (
+                now - cached[0] < self.PRICE_CACHE_TTL
+                or _usd_value_micros(token.raw_balance, token.decimals, cached[1]) < self.DUST_VALUE_MICROS
+            ):
+                prices[address] = cached[1]
             else:
-                print(f"No price found for {token.symbol} ({address}) on {platform_slug}")
-                return None
-        except Exception as e:
-            print(f"CoinGecko error fetching price for {token.symbol}: {e}")
-            return None
-
-    def _get_balance_and_price(self, token: Token, min_balance: Decimal) -> Optional[Token]:
-        balance = self.get_token_balance(token)
-        if balance <= min_balance:
-            return None
-
-        token.balance = balance
-        token.usd_price = self.get_token_usd_price(token)
-        if token.usd_price:
-            token.usd_value = token.balance * token.usd_price
+                stale_addresses.add(address)
+
+        if stale_addresses:
+            fetched = await self._fetch_prices_for_chain(chain_id, sorted(stale_addresses))
+            fetched_at = time.monotonic()
+            for address, usd_price_scaled in fetched.items():
+                self._price_cache[(chain_id, address)] = (fetched_at, usd_price_scaled)
+            prices.update(fetched)
+
+        total_value_micros = 0
+        for token in held_tokens:
+            address = self._get_token_address(token)
+            token.usd_price_scaled = prices.get(address)
+            if token.usd_price_scaled is not None:
+                token.usd_value_micros = _usd_value_micros(token.raw_balance, token.decimals, token.usd_price_scaled)
+                total_value_micros += token.usd_value_micros
+            else:
+                print(f"No price found for {token.symbol} ({address}) on chain {chain_id}")
 
-        return token
+        return held_tokens, total_value_micros
 
-    def get_portfolio(self, min_balance: Decimal = Decimal("0.000001")) -> List[Token]:
+    async def get_portfolio(
+        self, wallet: str, min_balance: Decimal = Decimal("0.000001")
+    ) -> tuple[List[Token], int]:
+        """Returns the wallet's held tokens sorted by value, and their total value in micro-USD"""
+        wallet = Web3.to_checksum_address(wallet)
         print("Fetching all tokens across chains...")
-        tokens = self.fetch_tokens()
-        self.portfolio = []
-
-        print("Checking balances and prices in parallel...")
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {
-                executor.submit(self._get_balance_and_price, token, min_balance): token
-                for token in tokens
-            }
-            for future in as_completed(futures):
-                token = futures[future]
-                try:
-                    result = future.result()
-                    if result:
-                        self.portfolio.append(result)
-                except Exception as e:
-                    print(f"Error with {token.symbol} on chain {token.chain_id}: {e}")
-
-        print(f"Found {len(self.portfolio)} tokens with non-zero balance.")
-        self.portfolio.sort(key=lambda x: x.usd_value or x.balance, reverse=True)
-
-        return self.portfolio
-
-    def print_portfolio(self, min_balance: Decimal = Decimal("0.000001")):
-        if self.portfolio == []:
-            self.portfolio = self.get_portfolio(min_balance=min_balance)
-
-        if not self.portfolio:
+        chain_ids = list(self.chains)
+        # Token lists are already per chain, so there is no need to flatten and regroup them
+        token_lists = await asyncio.gather(*[self._get_token_list(chain_id) for chain_id in chain_ids])
+
+        print("Checking balances and prices across chains concurrently...")
+        results = await asyncio.gather(*[
+            self._get_chain_portfolio(chain_id, wallet, chain_tokens, min_balance)
+            for chain_id, chain_tokens in zip(chain_ids, token_lists)
+            if chain_tokens
+        ])
+
+        # Only held tokens reach this point, so a single sort over them is all that's left
+        portfolio = sorted(
+            itertools.chain.from_iterable(held_tokens for held_tokens, _ in results),
+            key=_portfolio_sort_key,
+            reverse=True
+        )
+        total_value_micros = sum(chain_total for _, chain_total in results)
+        print(f"Found {len(portfolio)} tokens with non-zero balance.")
+
+        return portfolio, total_value_micros
+
+    async def print_portfolio(self, wallet: str, min_balance: Decimal = Decimal("0.000001")):
+        portfolio, total_value_micros = await self.get_portfolio(wallet, min_balance=min_balance)
+
+        if not portfolio:
             print("No tokens found with balance above threshold.")
             return
 
-        print(f"\nPortfolio for {self.wallet}")
+        print(f"\nPortfolio for {Web3.to_checksum_address(wallet)}")
         print("=" * 80)
         print(f"{'CHAIN':<15} {'SYMBOL':<10} {'BALANCE':>20} {'USD VALUE':>20}")
         print("-" * 80)
 
-        total_value = Decimal("0")
-
-        for token in self.portfolio:
+        for token in portfolio:
             chain = self.chains[token.chain_id]["name"]
             symbol = token.symbol
             balance_str = f"{token.balance:.6f}"
             usd_str = f"${token.usd_value:,.2f}" if token.usd_value else "-"
             print(f"{chain:<15} {symbol:<10} {balance_str:>20} {usd_str:>20}")
 
-            if token.usd_value:
-                total_value += token.usd_value
-
+        total_value = scaled_to_decimal(total_value_micros, USD_DECIMALS)
         print("-" * 80)
         print(f"{'TOTAL':<15} {'':<10} {'':>20} {'$' + format(total_value, ',.2f'):>20}")
 
@@ -248,6 +507,12 @@ if __name__ == "__main__":
         print("Usage: python portfolio.py <wallet_address>")
         sys.exit(1)
 
+    async def main():
+        async with create_http_client() as http_client:
+            portfolio = TxPortfolio(http_client)
+            try:
+                await portfolio.print_portfolio(sys.argv[1])
+            finally:
+                await portfolio.close()
 
-    portfolio = TxPortfolio(sys.argv[1])
-    portfolio.print_portfolio()
+    asyncio.run(main())